@@ -36,3 +36,23 @@ class TransactionTestCase(TestCase):
         )
 
         self.assertEqual(repr(txn), expected)
+
+    def test_transaction_to_dict(self):
+        dt = pd.Timestamp('2017-01-01')
+
+        asset = Equity(
+            1,
+            exchange_info=ExchangeInfo('test', 'test full', 'US'),
+        )
+        txn = Transaction(asset, amount=100, dt=dt, price=10, order_id=0)
+
+        expected = {
+            'amount': 100,
+            'dt': dt,
+            'price': 10,
+            'order_id': 0,
+            'sid': asset,
+            'commission': None,
+        }
+
+        self.assertEqual(txn.to_dict(), expected)
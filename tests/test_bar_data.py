@@ -15,6 +15,7 @@
 from datetime import timedelta, time
 from itertools import chain
 
+from mock import patch
 from nose_parameterized import parameterized
 import numpy as np
 from numpy import nan
@@ -1012,6 +1013,62 @@ class TestDailyBarData(WithCreateBarData,
 
             self.assertEqual(session, bar_data.current_session)
 
+    def test_session_label_is_cached_per_dt(self):
+        calendar = self.data_portal.trading_calendar
+        session = pd.Timestamp('2016-01-07', tz='UTC')
+        prev_session = pd.Timestamp('2016-01-06', tz='UTC')
+        session_open = calendar.open_and_close_for_session(session)[0]
+        prev_close = calendar.previous_minute(session_open)
+
+        # ``current_dt`` is swapped below to hand BarData a new dt object.
+        current_dt = [session_open]
+        bar_data = self.create_bardata(
+            simulation_dt_func=lambda: current_dt[0],
+        )
+
+        def label_calls_for(dt):
+            # The data portal converts dts with the same calendar, so only
+            # count the calls BarData makes for the simulation dt itself.
+            return [
+                call for call in to_label.call_args_list
+                if call[0][0] == dt
+            ]
+
+        with patch.object(
+            calendar,
+            'minute_to_session_label',
+            wraps=calendar.minute_to_session_label,
+        ) as to_label:
+            expected = self.data_portal.get_spot_value(
+                self.ASSET1, 'close', session, 'daily',
+            )
+            for _ in range(3):
+                self.assertEqual(
+                    bar_data.current(self.ASSET1, 'close'),
+                    expected,
+                )
+            self.assertEqual(len(label_calls_for(session_open)), 1)
+
+            # An equal but distinct dt object is looked up again.
+            current_dt[0] = pd.Timestamp(session_open.value, tz='UTC')
+            self.assertIsNot(current_dt[0], session_open)
+            self.assertEqual(
+                bar_data.current(self.ASSET1, 'close'),
+                expected,
+            )
+            self.assertEqual(len(label_calls_for(session_open)), 2)
+
+            # Adjusting to the previous market minute yields that minute's
+            # session rather than the cached label.
+            with handle_non_market_minutes(bar_data):
+                self.assertEqual(
+                    bar_data.current(self.ASSET1, 'close'),
+                    self.data_portal.get_spot_value(
+                        self.ASSET1, 'close', prev_session, 'daily',
+                    ),
+                )
+            self.assertEqual(len(label_calls_for(prev_close)), 1)
+
     def test_day_before_assets_trading(self):
         # use the day before self.bcolz_daily_bar_days[0]
         minute = self.get_last_minute_of_session(
@@ -152,6 +152,43 @@ class BlotterTestCase(WithCreateBarData,
         self.assertEqual(len(blotter.open_orders), 1)
         self.assertEqual(list(blotter.open_orders), [self.asset_25])
 
+    def test_closing_last_open_order_removes_asset(self):
+        for close_order, expected_status in (
+            (SimulationBlotter.cancel, ORDER_STATUS.CANCELLED),
+            (SimulationBlotter.reject, ORDER_STATUS.REJECTED),
+        ):
+            blotter = SimulationBlotter()
+
+            oid = blotter.order(self.asset_24, 100, MarketOrder())
+            blotter.order(self.asset_25, 150, MarketOrder())
+
+            close_order(blotter, oid)
+            self.assertNotIn(self.asset_24, blotter.open_orders)
+            self.assertEqual(list(blotter.open_orders), [self.asset_25])
+            self.assertEqual(blotter.orders[oid].status, expected_status)
+
+    def test_get_transactions_skips_empty_open_order_lists(self):
+        simulated_assets = []
+
+        class RecordingSlippage(FixedSlippage):
+            def simulate(self, data, asset, orders_for_asset):
+                simulated_assets.append(asset)
+                return iter(())
+
+        blotter = SimulationBlotter(equity_slippage=RecordingSlippage())
+        blotter.order(self.asset_25, 100, MarketOrder())
+
+        # Reading through the defaultdict leaves an empty list behind, as
+        # algorithms that inspect ``blotter.open_orders`` directly can do.
+        self.assertEqual(blotter.open_orders[self.asset_24], [])
+
+        dt = self.sim_params.sessions[0]
+        blotter.current_dt = dt
+        bar_data = self.create_bardata(simulation_dt_func=lambda: dt)
+        blotter.get_transactions(bar_data)
+
+        self.assertEqual(simulated_assets, [self.asset_25])
+
     def test_blotter_eod_cancellation(self):
         blotter = SimulationBlotter(cancel_policy=EODCancel())
 
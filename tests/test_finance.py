@@ -338,15 +338,11 @@ class FinanceTestCase(zf.WithAssetFinder,
 
             if complete_fill:
                 self.assertEqual(len(transactions), len(order_list))
-
-            total_volume = 0
-            for i in range(len(transactions)):
-                txn = transactions[i]
-                total_volume += txn.amount
-                if complete_fill:
-                    order = order_list[i]
+                for order, txn in zip(order_list, transactions):
                     self.assertEqual(order.amount, txn.amount)
 
+            total_volume = sum(txn.amount for txn in transactions)
+
             self.assertEqual(total_volume, expected_txn_volume)
 
             self.assertEqual(len(transactions), expected_txn_count)
@@ -413,8 +409,8 @@ class SimParamsTestCase(zf.WithTradingCalendars, zf.ZiplineTestCase):
             trading_calendar=self.trading_calendar,
         )
 
-        self.assertTrue(sp.last_close.month == 12)
-        self.assertTrue(sp.last_close.day == 31)
+        self.assertEqual(sp.last_close.month, 12)
+        self.assertEqual(sp.last_close.day, 31)
 
     @timed(DEFAULT_TIMEOUT)
     def test_sim_params_days_in_period(self):
@@ -447,7 +443,7 @@ class SimParamsTestCase(zf.WithTradingCalendars, zf.ZiplineTestCase):
         )
 
         num_expected_trading_days = 5
-        self.assertEquals(
+        self.assertEqual(
             num_expected_trading_days,
             len(params.sessions)
         )
@@ -175,6 +175,9 @@ cdef class BarData:
 
     cdef bool _adjust_minutes
 
+    cdef object _last_session_minute
+    cdef object _last_session_label
+
     def __init__(self, data_portal, simulation_dt_func, data_frequency,
                  trading_calendar, restrictions, universe_func=None):
         self.data_portal = data_portal
@@ -190,6 +193,9 @@ cdef class BarData:
 
         self._adjust_minutes = False
 
+        self._last_session_minute = None
+        self._last_session_label = None
+
         self._trading_calendar = trading_calendar
         self._is_restricted = restrictions.is_restricted
 
@@ -250,7 +256,16 @@ cdef class BarData:
         if self._daily_mode:
             # if we're in daily mode, take the given dt (which is the last
             # minute of the session) and get the session label for it.
-            dt = self.data_portal.trading_calendar.minute_to_session_label(dt)
+            # The simulation hands us the same dt object for every query made
+            # within a bar, so remember the last conversion instead of
+            # searching the calendar on every call.
+            if dt is not self._last_session_minute:
+                self._last_session_label = \
+                    self.data_portal.trading_calendar.minute_to_session_label(
+                        dt,
+                    )
+                self._last_session_minute = dt
+            dt = self._last_session_label
 
         return dt
 
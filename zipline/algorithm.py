@@ -704,17 +704,16 @@ class TradingAlgorithm(object):
                 )
             )
 
-            log.info('Processing capital change to target %s at %s. Capital '
-                     'change delta is %s' % (target, dt,
-                                             capital_change_amount))
+            log.info('Processing capital change to target {} at {}. Capital '
+                     'change delta is {}', target, dt, capital_change_amount)
         elif capital_change['type'] == 'delta':
             target = None
             capital_change_amount = capital_change['value']
-            log.info('Processing capital change of delta %s at %s'
-                     % (capital_change_amount, dt))
+            log.info('Processing capital change of delta {} at {}',
+                     capital_change_amount, dt)
         else:
-            log.error("Capital change %s does not indicate a valid type "
-                      "('target' or 'delta')" % capital_change)
+            log.error("Capital change {} does not indicate a valid type "
+                      "('target' or 'delta')", capital_change)
             return
 
         self.capital_change_deltas.update({dt: capital_change_amount})
@@ -1215,7 +1214,7 @@ class TradingAlgorithm(object):
                 log.warn("Cannot place order for {0}, as it has de-listed. "
                          "Any existing positions for this asset will be "
                          "liquidated on "
-                         "{1}.".format(asset.symbol, asset.auto_close_date))
+                         "{1}.", asset.symbol, asset.auto_close_date)
 
                 return False
 
@@ -1487,7 +1486,7 @@ class TradingAlgorithm(object):
             The current simulation datetime converted to ``tz``.
         """
         dt = self.datetime
-        assert dt.tzinfo == pytz.utc, "Algorithm should have a utc datetime"
+        assert dt.tzinfo is pytz.utc, "Algorithm should have a utc datetime"
         if tz is not None:
             dt = dt.astimezone(tz)
         return dt
@@ -160,9 +160,7 @@ class SimulationBlotter(Blotter):
         cur_order = self.orders[order_id]
 
         if cur_order.open:
-            order_list = self.open_orders[cur_order.asset]
-            if cur_order in order_list:
-                order_list.remove(cur_order)
+            self._remove_open_order(cur_order)
 
             if cur_order in self.new_orders:
                 self.new_orders.remove(cur_order)
@@ -198,12 +196,11 @@ class SimulationBlotter(Blotter):
                         '{order_filled} shares were successfully '
                         'purchased. {order_failed} shares were not '
                         'filled by the end of day and '
-                        'were canceled.'.format(
-                            order_amt=order.amount,
-                            order_sym=order.asset.symbol,
-                            order_filled=order.filled,
-                            order_failed=order.amount - order.filled,
-                        )
+                        'were canceled.',
+                        order_amt=order.amount,
+                        order_sym=order.asset.symbol,
+                        order_filled=order.filled,
+                        order_failed=order.amount - order.filled,
                     )
                 elif order.filled < 0:
                     warning_logger.warn(
@@ -212,25 +209,23 @@ class SimulationBlotter(Blotter):
                         '{order_filled} shares were successfully '
                         'sold. {order_failed} shares were not '
                         'filled by the end of day and '
-                        'were canceled.'.format(
-                            order_amt=order.amount,
-                            order_sym=order.asset.symbol,
-                            order_filled=-1 * order.filled,
-                            order_failed=-1 * (order.amount - order.filled),
-                        )
+                        'were canceled.',
+                        order_amt=order.amount,
+                        order_sym=order.asset.symbol,
+                        order_filled=-1 * order.filled,
+                        order_failed=-1 * (order.amount - order.filled),
                     )
                 else:
                     warning_logger.warn(
                         'Your order for {order_amt} shares of '
                         '{order_sym} failed to fill by the end of day '
-                        'and was canceled.'.format(
-                            order_amt=order.amount,
-                            order_sym=order.asset.symbol,
-                        )
+                        'and was canceled.',
+                        order_amt=order.amount,
+                        order_sym=order.asset.symbol,
                     )
 
         assert not orders
-        del self.open_orders[asset]
+        self.open_orders.pop(asset, None)
 
     def execute_cancel_policy(self, event):
         if self.cancel_policy.should_cancel(event):
@@ -251,9 +246,7 @@ class SimulationBlotter(Blotter):
 
         cur_order = self.orders[order_id]
 
-        order_list = self.open_orders[cur_order.asset]
-        if cur_order in order_list:
-            order_list.remove(cur_order)
+        self._remove_open_order(cur_order)
 
         if cur_order in self.new_orders:
             self.new_orders.remove(cur_order)
@@ -263,6 +256,26 @@ class SimulationBlotter(Blotter):
         # along with newly placed orders.
         self.new_orders.append(cur_order)
 
+    def _remove_open_order(self, order):
+        """
+        Remove ``order`` from the open orders of its asset, dropping the
+        asset's entry from ``open_orders`` if it no longer has any open orders.
+        """
+        asset = order.asset
+        # Use ``get`` so that we don't insert an empty list into the
+        # defaultdict for an asset that has no open orders.
+        order_list = self.open_orders.get(asset)
+        if order_list is None:
+            return
+
+        try:
+            order_list.remove(order)
+        except ValueError:
+            return
+
+        if not order_list:
+            del self.open_orders[asset]
+
     def hold(self, order_id, reason=''):
         """
         Mark the order with order_id as 'held'. Held is functionally similar
@@ -339,6 +352,12 @@ class SimulationBlotter(Blotter):
 
         if self.open_orders:
             for asset, asset_orders in iteritems(self.open_orders):
+                # Reads through the ``open_orders`` defaultdict from outside
+                # the blotter can leave empty lists behind; there is nothing
+                # to simulate for those.
+                if not asset_orders:
+                    continue
+
                 slippage = self.slippage_models[type(asset)]
 
                 for order, txn in \
@@ -377,17 +396,10 @@ class SimulationBlotter(Blotter):
         -------
         None
         """
-        # remove all closed orders from our open_orders dict
+        # remove all closed orders from our open_orders dict, clearing out the
+        # assets that are left with zero open orders. Only the assets of the
+        # closed orders are cleaned up here; empty lists created by reading
+        # ``open_orders`` from outside the blotter are left in place and
+        # skipped by ``get_transactions``.
         for order in closed_orders:
-            asset = order.asset
-            asset_orders = self.open_orders[asset]
-            try:
-                asset_orders.remove(order)
-            except ValueError:
-                continue
-
-        # now clear out the assets from our open_orders dict that have
-        # zero open orders
-        for asset in list(self.open_orders.keys()):
-            if len(self.open_orders[asset]) == 0:
-                del self.open_orders[asset]
+            self._remove_open_order(order)
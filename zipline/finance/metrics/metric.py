@@ -527,7 +527,9 @@ class PeriodLabel(object):
     """Backwards compat, please kill me.
     """
     def start_of_session(self, ledger, session, data_portal):
-        self._label = session.strftime('%Y-%m')
+        # Equivalent to ``session.strftime('%Y-%m')`` without going through
+        # the libc formatter on every session.
+        self._label = '%04d-%02d' % (session.year, session.month)
 
     def end_of_bar(self, packet, *args):
         packet['cumulative_risk_metrics']['period_label'] = self._label
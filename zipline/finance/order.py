@@ -30,6 +30,10 @@ ORDER_STATUS = enum(
     'HELD',
 )
 
+# The statuses for which an order is still considered open. This is checked
+# for every open order on every bar, so build it once here.
+_OPEN_STATUSES = frozenset([ORDER_STATUS.OPEN, ORDER_STATUS.HELD])
+
 SELL = 1 << 0
 BUY = 1 << 1
 STOP = 1 << 2
@@ -224,7 +228,7 @@ class Order(object):
 
     @property
     def open(self):
-        return self.status in [ORDER_STATUS.OPEN, ORDER_STATUS.HELD]
+        return self.status in _OPEN_STATUSES
 
     @property
     def triggered(self):
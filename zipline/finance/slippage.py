@@ -198,7 +198,7 @@ class SlippageModel(with_metaclass(FinancialModelMeta)):
                 if execution_price is not None:
                     txn = create_transaction(
                         order,
-                        data.current_dt,
+                        dt,
                         execution_price,
                         execution_volume
                     )
@@ -18,7 +18,6 @@ A source to be used in testing.
 """
 
 from datetime import timedelta
-import itertools
 
 from six.moves import range
 
@@ -140,11 +139,6 @@ class SpecificEquityTrades(object):
     def rewind(self):
         self.generator = self.create_fresh_generator()
 
-    def update_source_id(self, gen):
-        for event in gen:
-            event.source_id = self.get_hash()
-            yield event
-
     def create_fresh_generator(self):
         date_generator = date_gen(
             start=self.start,
@@ -152,13 +146,15 @@ class SpecificEquityTrades(object):
             delta=self.delta,
             trading_calendar=self.trading_calendar,
         )
+        # Iterate the dates lazily rather than through itertools.product,
+        # which would materialize the whole date stream up front.
         return (
             create_trade(
                 sid=sid,
                 price=float(i % 10) + 1.0,
                 amount=(i * 50) % 900 + 100,
                 datetime=date,
-            ) for (i, date), sid in itertools.product(
-                enumerate(date_generator), self.sids
             )
+            for i, date in enumerate(date_generator)
+            for sid in self.sids
         )
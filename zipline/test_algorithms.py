@@ -243,7 +243,7 @@ class EmptyPositionsAlgorithm(TradingAlgorithm):
 
             if (
                 len(amounts) > 0 and
-                all([(amount == 1) for amount in amounts])
+                all(amount == 1 for amount in amounts)
             ):
                 for stock in self.portfolio.positions:
                     self.order(self.sid(stock), -1)
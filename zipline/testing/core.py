@@ -84,16 +84,13 @@ def str_to_seconds(s):
 
 
 def drain_zipline(test, zipline):
-    output = []
-    transaction_count = 0
-    msg_counter = 0
     # start the simulation
-    for update in zipline:
-        msg_counter += 1
-        output.append(update)
-        if 'daily_perf' in update:
-            transaction_count += \
-                len(update['daily_perf']['transactions'])
+    output = list(zipline)
+    transaction_count = sum(
+        len(update['daily_perf']['transactions'])
+        for update in output
+        if 'daily_perf' in update
+    )
 
     return output, transaction_count
 
@@ -115,8 +112,7 @@ def check_algo_results(test,
     if expected_order_count is not None:
         # de-dup orders on id, because orders are put back into perf packets
         # whenever they a txn is filled
-        orders = set([order['id'] for order in
-                      flatten_list(results["orders"])])
+        orders = {order['id'] for order in flatten_list(results["orders"])}
 
         test.assertEqual(expected_order_count, len(orders))
 
@@ -13,36 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ctypes import (
-    Structure,
-    c_ubyte,
-    c_uint,
-    c_ulong,
-    c_ulonglong,
-    c_ushort,
-    sizeof,
-)
-
-import numpy as np
-import pandas as pd
-from six.moves import range
-
-
-_inttypes_map = {
-    sizeof(t) - 1: t for t in {
-        c_ubyte,
-        c_uint,
-        c_ulong,
-        c_ulonglong,
-        c_ushort
-    }
-}
-_inttypes = list(
-    pd.Series(_inttypes_map).reindex(
-        range(max(_inttypes_map.keys())),
-        method='bfill',
-    ),
-)
+from collections import namedtuple
 
 
 def enum(option, *options):
@@ -73,6 +44,13 @@ def enum(option, *options):
     >>> tuple(e)
     (0, 1, 2)
 
+    Enum members are plain ints and the enum itself is immutable:
+
+    >>> e.a = 3  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+       ...
+    AttributeError: can't set attribute
+
     Notes
     -----
     Identity checking is not guaranteed to work with enum members, instead
@@ -85,30 +63,19 @@ def enum(option, *options):
     this case is undefined. :-)"
     """
     options = (option,) + options
-    rangeob = range(len(options))
-
-    try:
-        inttype = _inttypes[int(np.log2(len(options) - 1)) // 8]
-    except IndexError:
-        raise OverflowError(
-            'Cannot store enums with more than sys.maxsize elements, got %d' %
-            len(options),
-        )
-
-    class _enum(Structure):
-        _fields_ = [(o, inttype) for o in options]
+    noptions = len(options)
 
-        def __iter__(self):
-            return iter(rangeob)
+    class _enum(namedtuple('_enum', options)):
+        __slots__ = ()
 
         def __contains__(self, value):
-            return 0 <= value < len(options)
+            return 0 <= value < noptions
 
         def __repr__(self):
             return '<enum: %s>' % (
-                ('%d fields' % len(options))
-                if len(options) > 10 else
+                ('%d fields' % noptions)
+                if noptions > 10 else
                 repr(options)
             )
 
-    return _enum(*rangeob)
+    return _enum(*range(noptions))
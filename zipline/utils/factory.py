@@ -71,13 +71,11 @@ def get_next_trading_dt(current, interval, trading_calendar):
     while True:
         # Convert timestamp to naive before adding day, otherwise the when
         # stepping over EDT an hour is added.
-        next_dt = pd.Timestamp(next_dt.replace(tzinfo=None))
-        next_dt = next_dt + interval
+        next_dt = next_dt.replace(tzinfo=None) + interval
         next_dt = pd.Timestamp(next_dt, tz=trading_calendar.tz)
         next_dt_utc = next_dt.tz_convert('UTC')
         if trading_calendar.is_open_on_minute(next_dt_utc):
             break
-        next_dt = next_dt_utc.tz_convert(trading_calendar.tz)
 
     return next_dt_utc
 
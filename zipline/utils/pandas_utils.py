@@ -268,7 +268,7 @@ def categorical_df_concat(df_list, inplace=False):
 
     # Assert each dataframe has the same columns/dtypes
     df = df_list[0]
-    if not all([(df.dtypes.equals(df_i.dtypes)) for df_i in df_list[1:]]):
+    if not all(df.dtypes.equals(df_i.dtypes) for df_i in df_list[1:]):
         raise ValueError("Input DataFrames must have the same columns/dtypes.")
 
     categorical_columns = df.columns[df.dtypes == 'category']